@@ -0,0 +1,169 @@
+import argparse
+import time
+import tracemalloc
+from typing import Dict
+
+from bs4 import BeautifulSoup
+
+from new_pathoplexus_data import iter_accession_records, iter_decoded_chunks
+
+def parse_table_soup(content: bytes) -> Dict:
+    """Previous fetch_url_data parsing path: full BeautifulSoup tree with find_all"""
+    soup = BeautifulSoup(content, 'html.parser')
+    table = soup.find('table')
+    if not table:
+        raise ValueError("No table found in the response")
+
+    data = {}
+    headers = [th.get_text(strip=True) for th in table.find('thead').find_all('th')]
+
+    columns = {
+        'accession': next(i for i, h in enumerate(headers) if 'Accession' in h),
+        'collection_date': next(i for i, h in enumerate(headers) if 'Collection date' in h),
+        'subdivision': next(i for i, h in enumerate(headers) if 'subdivision level 1' in h.lower()),
+        'authors': next(i for i, h in enumerate(headers) if 'Authors' in h)
+    }
+
+    for row in table.find('tbody').find_all('tr'):
+        cells = row.find_all('td')
+        acc = cells[columns['accession']].get_text(strip=True).split('.')[0]
+        data[acc] = {
+            'collection_date': cells[columns['collection_date']].get_text(strip=True).replace('"', ''),
+            'subdivision': cells[columns['subdivision']].get_text(strip=True).replace('"', ''),
+            'authors': cells[columns['authors']].get_text(strip=True).replace('"', '')
+        }
+
+    return data
+
+def parse_table_stream(content: bytes, chunk_size: int = 64 * 1024) -> Dict:
+    """Streaming path used by fetch_url_data, fed in network-sized chunks"""
+    chunks = (content[i:i + chunk_size] for i in range(0, len(content), chunk_size))
+    return dict(iter_accession_records(iter_decoded_chunks(chunks)))
+
+def make_synthetic_page(n_rows: int) -> bytes:
+    """Build a Pathoplexus-like results page with n_rows accessions"""
+    subdivisions = ['Nebraska', 'Black Hawk, Iowa', 'San Gabriel Val…', '"Lexington,MA"', 'Polk &amp; Story, Iowa']
+    rows = []
+    for i in range(n_rows):
+        rows.append(
+            '<tr>'
+            f'<td><a href="/seq/PP_{i:07d}.1"> <span>PP_{i:07d}</span>.1 </a></td>'
+            f'<td>{2000 + i % 25}-{1 + i % 12:02d}-{1 + i % 28:02d}</td>'
+            '<td>USA</td>'
+            f'<td>\n  {subdivisions[i % len(subdivisions)]}\n</td>'
+            f'<td>Smith, J.; <!-- lab --> Doe, A. {i}</td>'
+            f'<td>{41.0 + (i % 100) / 100:.2f}</td>'
+            '</tr>\n'
+        )
+    page = (
+        '<!DOCTYPE html><html><head><meta charset="utf-8"><title>Search</title></head><body>'
+        '<div class="results"><table><thead><tr>'
+        '<th><button>Accession</button></th><th>Collection date</th><th>Country</th>'
+        '<th>Geographic subdivision level 1</th><th>Authors</th><th>Latitude</th>'
+        '</tr></thead><tbody>\n'
+        + ''.join(rows)
+        + '</tbody></table></div></body></html>'
+    )
+    return page.encode('utf-8')
+
+EDGE_HEADER = (
+    '<table><thead><tr><th>Accession</th><th>Collection date</th>'
+    '<th>Geographic subdivision level 1</th><th>Authors</th></tr></thead>'
+)
+
+# Pages whose streaming output must match BeautifulSoup exactly
+SOUP_PARITY_CASES = {
+    'no </tr>': EDGE_HEADER + '<tbody><tr><td>A.1</td><td>2020</td><td>NE</td><td>X</td>'
+                              '<tr><td>B.1</td><td>2021</td><td>IA</td><td>Y</td></tbody></table>',
+    'no </tr> or </tbody>': EDGE_HEADER + '<tbody><tr><td>A.1</td><td>2020</td><td>NE</td><td>X</td>'
+                                          '<tr><td>B.1</td><td>2021</td><td>IA</td><td>Y</td></table>',
+    'script/style/template in cells': EDGE_HEADER + '<tbody><tr><td>A<script>var a = "x";</script>.1</td>'
+                                                    '<td>2020<style>.a{}</style></td><td>NE<template>t</template></td>'
+                                                    '<td>X</td></tr></tbody></table>',
+    'two <tbody>': EDGE_HEADER + '<tbody><tr><td>A.1</td><td>2020</td><td>NE</td><td>X</td></tr></tbody>'
+                                 '<tbody><tr><td>B.1</td><td>2021</td><td>IA</td><td>Y</td></tr></tbody></table>',
+    'nested <tbody>': EDGE_HEADER + '<tbody><tr><td>A.1</td><td>2020</td><td>NE</td><td>X</td></tr>'
+                                    '<tbody><tr><td>B.1</td><td>2021</td><td>IA</td><td>Y</td></tr></tbody></table>',
+    'meta charset': '<html><head><meta charset="windows-1252"></head><body>' + EDGE_HEADER
+                    + '<tbody><tr><td>A.1</td><td>2020</td><td>Montréal</td><td>Müller</td></tr></tbody></table>',
+}
+
+# Pages with omitted </th>/</td>: BeautifulSoup nests the cells and concatenates their text,
+# so the streaming output is compared with the same page with the end tags written out
+IMPLIED_END_TAG_CASES = {
+    'no </td>': (
+        EDGE_HEADER + '<tbody><tr><td>A.1<td>2020<td>NE<td>X</tr><tr><td>B.1<td>2021<td>IA<td>Y</tr></tbody></table>',
+        EDGE_HEADER + '<tbody><tr><td>A.1</td><td>2020</td><td>NE</td><td>X</td></tr>'
+                      '<tr><td>B.1</td><td>2021</td><td>IA</td><td>Y</td></tr></tbody></table>',
+    ),
+    'no </th>, </td> or </tr>': (
+        '<table><thead><tr><th>Accession<th>Collection date<th>Geographic subdivision level 1<th>Authors'
+        '<tbody><tr><td>A.1<td>2020<td>NE<td>X<tr><td>B.1<td>2021<td>IA<td>Y</table>',
+        EDGE_HEADER + '<tbody><tr><td>A.1</td><td>2020</td><td>NE</td><td>X</td></tr>'
+                      '<tr><td>B.1</td><td>2021</td><td>IA</td><td>Y</td></tr></tbody></table>',
+    ),
+}
+
+# Pages whose layout changed must raise rather than look like "no new accessions"
+LAYOUT_ERROR_CASES = {
+    'no table': '<html><body><p>No results</p></body></html>',
+    'no <thead>': '<table><tbody><tr><td>A.1</td></tr></tbody></table>',
+    'no <tbody>': EDGE_HEADER + '</table>',
+}
+
+def check_edge_cases() -> None:
+    """Check the streaming parser on malformed and unusual pages"""
+    for name, page in SOUP_PARITY_CASES.items():
+        content = page.encode('windows-1252' if 'windows-1252' in page else 'utf-8')
+        for chunk_size in (1, 7, 64 * 1024):
+            if parse_table_stream(content, chunk_size) != parse_table_soup(content):
+                raise SystemExit(f"Output mismatch on '{name}' page (chunk size {chunk_size})")
+
+    for name, (page, expected_page) in IMPLIED_END_TAG_CASES.items():
+        expected = parse_table_soup(expected_page.encode('utf-8'))
+        for chunk_size in (1, 7, 64 * 1024):
+            if parse_table_stream(page.encode('utf-8'), chunk_size) != expected:
+                raise SystemExit(f"Output mismatch on '{name}' page (chunk size {chunk_size})")
+
+    for name, page in LAYOUT_ERROR_CASES.items():
+        try:
+            parse_table_stream(page.encode('utf-8'))
+        except ValueError:
+            continue
+        raise SystemExit(f"No error raised on '{name}' page")
+
+    print(f"Edge cases OK: {len(SOUP_PARITY_CASES) + len(IMPLIED_END_TAG_CASES) + len(LAYOUT_ERROR_CASES)} pages")
+
+def measure(func, content: bytes) -> tuple:
+    """Return (result, wall seconds, peak traced memory in MB)
+
+    Timing and memory are taken in separate runs since tracemalloc slows parsing down.
+    """
+    start = time.perf_counter()
+    result = func(content)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    func(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 1024 / 1024
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark streaming vs BeautifulSoup Pathoplexus table parsing")
+    parser.add_argument('--rows', type=int, nargs='+', default=[1000, 10000, 50000], help="synthetic page sizes")
+    args = parser.parse_args()
+
+    check_edge_cases()
+
+    print(f"{'rows':>8} {'page MB':>8} {'soup s':>8} {'stream s':>9} {'speedup':>8} {'soup MB':>8} {'stream MB':>10}")
+    for n_rows in args.rows:
+        content = make_synthetic_page(n_rows)
+        soup_data, soup_s, soup_mb = measure(parse_table_soup, content)
+        stream_data, stream_s, stream_mb = measure(parse_table_stream, content)
+
+        if soup_data != stream_data:
+            raise SystemExit(f"Output mismatch at {n_rows} rows")
+
+        print(f"{n_rows:>8} {len(content) / 1024 / 1024:>8.1f} {soup_s:>8.2f} {stream_s:>9.2f} "
+              f"{soup_s / stream_s:>7.1f}x {soup_mb:>8.1f} {stream_mb:>10.1f}")
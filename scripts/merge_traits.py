@@ -0,0 +1,41 @@
+import argparse
+import json
+import logging
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def merge_node_data(node_data_files: list) -> dict:
+    """Merge per-column `augur traits` node-data JSONs into a single node-data dict"""
+    merged = {'nodes': {}, 'models': {}}
+
+    for path in node_data_files:
+        with open(path) as handle:
+            node_data = json.load(handle)
+
+        for node, attrs in node_data.get('nodes', {}).items():
+            merged['nodes'].setdefault(node, {}).update(attrs)
+
+        merged['models'].update(node_data.get('models', {}))
+
+        # Keep any other top-level keys (e.g. generated_by) from the first file
+        for key, value in node_data.items():
+            if key not in ('nodes', 'models'):
+                merged.setdefault(key, value)
+
+    if not merged['models']:
+        del merged['models']
+
+    return merged
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Merge per-column augur traits node-data JSONs")
+    parser.add_argument('--node-data', nargs='+', required=True, help="per-column traits node-data JSONs")
+    parser.add_argument('--output', required=True, help="merged node-data JSON")
+    args = parser.parse_args()
+
+    merged = merge_node_data(args.node_data)
+    with open(args.output, 'w') as handle:
+        json.dump(merged, handle, indent=1)
+    logger.info(f"Merged {len(args.node_data)} traits files into {args.output}")
@@ -1,8 +1,9 @@
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
+import codecs
+from html.parser import HTMLParser
 import sys
-from typing import Dict, Optional, Tuple
+from typing import Dict, Iterable, Iterator, Optional, Tuple
 import logging
 from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
@@ -195,43 +196,260 @@ def extract_state_improved(text: str) -> tuple:
             
     return None, clean_text
 
+class AccessionTableParser(HTMLParser):
+    """Event-based parser for the first results table on a Pathoplexus search page
+
+    Header indices are resolved once when the <thead> ends; after that every
+    <tbody> row turns into an (accession, record) pair that is queued until
+    drain() hands it out, so only the current row is ever held in memory.
+    Omitted </th>, </td> and </tr> end tags are implied by the next cell, the
+    next row or the end of the body/table, as HTML allows. Like the old
+    table.find('tbody') lookup, only the first <tbody> is read; a <tbody> opened
+    inside it before it closes is nested there, as BeautifulSoup does.
+    """
+
+    # Text inside these elements is left out by BeautifulSoup's get_text()
+    SKIP_TEXT_TAGS = ('script', 'style', 'template')
+
+    def __init__(self):
+        super().__init__()
+        self.table_depth = 0
+        self.seen_table = False
+        self.seen_tbody = False
+        self.done = False
+        self.in_thead = False
+        self.in_tbody = False
+        self.tbody_depth = 0
+        self.skip_depth = 0
+        self.headers = []
+        self.columns = None
+        self.row = None
+        self.cell = None
+        self.text = []
+        self.records = []
+
+    def handle_starttag(self, tag, attrs):
+        self._flush_text()
+        if self.done or self.table_depth == 0 and tag != 'table':
+            return
+        if tag in self.SKIP_TEXT_TAGS:
+            self.skip_depth += 1
+        elif tag == 'table':
+            self.table_depth += 1
+            self.seen_table = True
+        elif tag == 'thead':
+            self.in_thead = True
+        elif tag == 'tbody':
+            self._end_thead()
+            if self.in_tbody:
+                self.tbody_depth += 1
+            elif not self.seen_tbody:
+                self.in_tbody = True
+                self.seen_tbody = True
+        elif tag == 'tr' and self.in_tbody:
+            self._end_row()
+            self.row = []
+        elif tag == 'th' and self.in_thead:
+            self._end_header_cell()
+            self.cell = []
+        elif tag == 'td' and self.row is not None:
+            self._end_cell()
+            self.cell = []
+
+    def handle_endtag(self, tag):
+        self._flush_text()
+        if self.done or self.table_depth == 0:
+            return
+        if tag in self.SKIP_TEXT_TAGS:
+            self.skip_depth = max(self.skip_depth - 1, 0)
+        elif tag == 'th' and self.in_thead:
+            self._end_header_cell()
+        elif tag == 'td' and self.row is not None:
+            self._end_cell()
+        elif tag == 'tr':
+            self._end_header_cell()
+            self._end_row()
+        elif tag == 'thead':
+            self._end_thead()
+        elif tag == 'tbody' and self.in_tbody:
+            if self.tbody_depth:
+                self.tbody_depth -= 1
+            else:
+                self._end_row()
+                self.in_tbody = False
+        elif tag == 'table':
+            self._end_thead()
+            self._end_row()
+            self.table_depth -= 1
+            # Only the first table on the page carries the results
+            if self.table_depth == 0:
+                self.done = True
+
+    def handle_data(self, data):
+        # A text node may arrive in pieces when it straddles two feed() chunks
+        if self.cell is not None and not self.skip_depth:
+            self.text.append(data)
+
+    def handle_comment(self, data):
+        self._flush_text()
+
+    def close(self):
+        super().close()
+        self._flush_text()
+        self._end_thead()
+        self._end_row()
+
+    def _flush_text(self):
+        # Matches BeautifulSoup's get_text(strip=True): strip each text node, drop empties
+        if self.text:
+            text = ''.join(self.text).strip()
+            self.text = []
+            if text and self.cell is not None:
+                self.cell.append(text)
+
+    def _end_header_cell(self):
+        if self.in_thead and self.cell is not None:
+            self.headers.append(''.join(self.cell))
+            self.cell = None
+
+    def _end_cell(self):
+        if self.row is not None and self.cell is not None:
+            self.row.append(''.join(self.cell))
+            self.cell = None
+
+    def _end_row(self):
+        if self.row is not None:
+            self._end_cell()
+            self.records.append(self._make_record(self.row))
+            self.row = None
+
+    def _end_thead(self):
+        if self.in_thead:
+            self._end_header_cell()
+            self.in_thead = False
+            self._resolve_columns()
+
+    def _resolve_columns(self):
+        if self.columns is not None:
+            return
+        matchers = {
+            'accession': lambda h: 'Accession' in h,
+            'collection_date': lambda h: 'Collection date' in h,
+            'subdivision': lambda h: 'subdivision level 1' in h.lower(),
+            'authors': lambda h: 'Authors' in h
+        }
+        columns = {}
+        for name, matches in matchers.items():
+            index = next((i for i, h in enumerate(self.headers) if matches(h)), None)
+            if index is None:
+                raise ValueError(f"No '{name}' column found in the table header")
+            columns[name] = index
+        self.columns = columns
+
+    def _make_record(self, cells: list) -> Tuple[str, Dict]:
+        if self.columns is None:
+            raise ValueError("No table header found before the table rows")
+        columns = self.columns
+        acc = cells[columns['accession']].split('.')[0]
+
+        # CLEAN QUOTES HERE - this prevents the quote issue
+        return acc, {
+            'collection_date': cells[columns['collection_date']].replace('"', ''),
+            'subdivision': cells[columns['subdivision']].replace('"', ''),
+            'authors': cells[columns['authors']].replace('"', '')
+        }
+
+    def drain(self) -> list:
+        """Return and clear the records completed since the last call"""
+        records, self.records = self.records, []
+        return records
+
+def iter_accession_records(chunks: Iterable[str]) -> Iterator[Tuple[str, Dict]]:
+    """Stream decoded HTML chunks through the table parser, yielding (accession, record) pairs"""
+    parser = AccessionTableParser()
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from parser.drain()
+        if parser.done:
+            break
+    parser.close()
+    yield from parser.drain()
+
+    # A missing table, header or body means the page layout changed, not that there is no data
+    if not parser.seen_table:
+        raise ValueError("No table found in the response")
+    if parser.columns is None:
+        raise ValueError("No table header found in the response")
+    if not parser.seen_tbody:
+        raise ValueError("No table body found in the response")
+
+def sniff_encoding(head: bytes, http_encoding: Optional[str] = None) -> str:
+    """Pick the encoding for a page from the start of its body
+
+    Follows the order BeautifulSoup's UnicodeDammit used on the old path: a UTF-8 BOM,
+    then a <meta charset> / http-equiv declaration, then UTF-8. The HTTP charset stands
+    in for UnicodeDammit's chardet guess before the UTF-8 fallback. Unlike UnicodeDammit
+    there is no retry with another encoding if the chosen one fails to decode; bad bytes
+    are replaced instead.
+    """
+    if head.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+
+    candidates = []
+    meta = re.search(rb'<\s*meta[^>]+charset\s*=\s*["\']?([-\w.:]+)', head, re.IGNORECASE)
+    if meta:
+        candidates.append(meta.group(1).decode('ascii'))
+    if http_encoding:
+        candidates.append(http_encoding)
+
+    for encoding in candidates:
+        try:
+            return codecs.lookup(encoding).name
+        except LookupError:
+            logger.warning(f"Unknown page encoding: {encoding}")
+    return 'utf-8'
+
+def iter_decoded_chunks(chunks: Iterable[bytes], http_encoding: Optional[str] = None,
+                        sniff_size: int = 2048) -> Iterator[str]:
+    """Incrementally decode byte chunks, sniffing the encoding from the first sniff_size bytes"""
+    head = b''
+    decoder = None
+    for chunk in chunks:
+        if decoder is None:
+            head += chunk
+            if len(head) < sniff_size:
+                continue
+            decoder = codecs.getincrementaldecoder(sniff_encoding(head, http_encoding))(errors='replace')
+            chunk, head = head, b''
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    if decoder is None:
+        decoder = codecs.getincrementaldecoder(sniff_encoding(head, http_encoding))(errors='replace')
+    text = decoder.decode(head, final=True)
+    if text:
+        yield text
+
 def fetch_url_data(url: str, timeout: int = 30) -> Dict:
-    """Fetch data from URL with proper error handling"""
+    """Fetch data from URL with proper error handling
+
+    The page encoding comes from sniff_encoding(); see there for how it differs from
+    the BeautifulSoup detection used previously.
+    """
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
     }
     
     try:
-        response = requests.get(url, headers=headers, timeout=timeout)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        table = soup.find('table')
-        if not table:
-            raise ValueError("No table found in the response")
-            
-        data = {}
-        headers = [th.get_text(strip=True) for th in table.find('thead').find_all('th')]
-        
-        columns = {
-            'accession': next(i for i, h in enumerate(headers) if 'Accession' in h),
-            'collection_date': next(i for i, h in enumerate(headers) if 'Collection date' in h),
-            'subdivision': next(i for i, h in enumerate(headers) if 'subdivision level 1' in h.lower()),
-            'authors': next(i for i, h in enumerate(headers) if 'Authors' in h)
-        }
-        
-        for row in table.find('tbody').find_all('tr'):
-            cells = row.find_all('td')
-            acc = cells[columns['accession']].get_text(strip=True).split('.')[0]
-            
-            # CLEAN QUOTES HERE - this prevents the quote issue
-            data[acc] = {
-                'collection_date': cells[columns['collection_date']].get_text(strip=True).replace('"', ''),
-                'subdivision': cells[columns['subdivision']].get_text(strip=True).replace('"', ''),
-                'authors': cells[columns['authors']].get_text(strip=True).replace('"', '')
-            }
-            
-        return data
+        with requests.get(url, headers=headers, timeout=timeout, stream=True) as response:
+            response.raise_for_status()
+
+            # Only trust an explicit charset, not requests' ISO-8859-1 default for text/*
+            content_type = response.headers.get('Content-Type', '').lower()
+            http_encoding = response.encoding if 'charset' in content_type else None
+
+            chunks = iter_decoded_chunks(response.iter_content(chunk_size=64 * 1024), http_encoding)
+            return dict(iter_accession_records(chunks))
         
     except Exception as e:
         logger.error(f"Error fetching URL data: {str(e)}")
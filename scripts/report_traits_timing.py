@@ -0,0 +1,90 @@
+import argparse
+import csv
+import logging
+import os
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Slack for file timestamps and job scheduling overhead between stage jobs
+TIMESTAMP_SLACK = 1.0
+SCHEDULING_SLACK = 60.0
+
+def read_benchmark(path: str) -> tuple:
+    """Return (start, end, seconds) for a Snakemake benchmark file
+
+    Snakemake writes the benchmark file as its job finishes, so the file mtime marks
+    the job end and mtime minus the recorded seconds marks its start.
+    """
+    with open(path) as handle:
+        seconds = float(next(csv.DictReader(handle, delimiter='\t'))['s'])
+    end = os.path.getmtime(path)
+    return end - seconds, end, seconds
+
+def stage_is_same_run(stage: list, node_data_files: list) -> bool:
+    """Check the stage benchmarks all come from the run that produced the current node data
+
+    Benchmarks that were not regenerated keep mtimes from earlier runs. A benchmark that
+    ended before the earliest node-data file was written, or a stage span longer than
+    running every job back to back, means the jobs did not all run together.
+    """
+    earliest_node_data = min(os.path.getmtime(path) for path in node_data_files)
+    if any(end < earliest_node_data - TIMESTAMP_SLACK for _, end, _ in stage):
+        return False
+
+    span = max(end for _, end, _ in stage) - min(start for start, _, _ in stage)
+    return span <= sum(seconds for _, _, seconds in stage) + SCHEDULING_SLACK
+
+def report_traits_timing(ancestral: str, translate: str, trait_columns: list,
+                         traits_serial: str, node_data_files: list) -> list:
+    """Compare the post-refine stage against the single-run serial traits baseline"""
+    ancestral_bench = read_benchmark(ancestral)
+    translate_bench = read_benchmark(translate)
+    column_benches = [read_benchmark(path) for path in trait_columns]
+    serial_seconds = read_benchmark(traits_serial)[2]
+
+    chain = ancestral_bench[2] + translate_bench[2]
+    slowest_column = max(seconds for _, _, seconds in column_benches)
+
+    # Before the split, the serial traits job already ran alongside ancestral -> translate
+    old_stage = max(chain, serial_seconds)
+    best_new_stage = max(chain, slowest_column)
+
+    lines = [
+        f"ancestral + translate (s): {ancestral_bench[2]:.1f} + {translate_bench[2]:.1f} = {chain:.1f}",
+        f"Per-column traits (s): {', '.join(f'{seconds:.1f}' for _, _, seconds in column_benches)}",
+        f"Serial traits, all columns in one run (s): {serial_seconds:.1f}",
+        f"Previous stage, estimated as max(ancestral + translate, serial traits): {old_stage:.1f}s",
+        f"Best case with all traits columns concurrent: {best_new_stage:.1f}s "
+        f"(estimated gain {old_stage - best_new_stage:.1f}s)",
+    ]
+    if chain >= serial_seconds:
+        lines.append("Stage is bound by ancestral -> translate; splitting traits cannot shorten it")
+
+    stage = [ancestral_bench, translate_bench, *column_benches]
+    if stage_is_same_run(stage, node_data_files):
+        span = max(end for _, end, _ in stage) - min(start for start, _, _ in stage)
+        lines.append(f"Measured stage span, first start to last end: {span:.1f}s")
+        lines.append(f"Wall-time gain against the estimated previous stage: {old_stage - span:.1f}s")
+    else:
+        lines.append("Stage benchmarks come from different runs; skipping the measured span")
+
+    return lines
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Report post-refine stage wall time against the serial traits baseline")
+    parser.add_argument('--ancestral', required=True, help="benchmark TSV for the ancestral rule")
+    parser.add_argument('--translate', required=True, help="benchmark TSV for the translate rule")
+    parser.add_argument('--trait-columns', nargs='+', required=True, help="benchmark TSVs for the per-column traits rules")
+    parser.add_argument('--traits-serial', required=True, help="benchmark TSV for the serial traits baseline")
+    parser.add_argument('--node-data', nargs='+', required=True, help="node-data JSONs written by the stage jobs")
+    parser.add_argument('--output', required=True, help="text report")
+    args = parser.parse_args()
+
+    lines = report_traits_timing(args.ancestral, args.translate, args.trait_columns,
+                                 args.traits_serial, args.node_data)
+    for line in lines:
+        logger.info(line)
+    with open(args.output, 'w') as handle:
+        handle.write('\n'.join(lines) + '\n')